@@ -1,6 +1,5 @@
 import sys
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                          QLabel, QPushButton, QStackedWidget)
+from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QPushButton
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -1,16 +1,58 @@
 import sys
 import os
+from typing import Final
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QLabel, QPushButton, QStackedWidget)
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtMultimedia import QMediaPlayer
-from PyQt6.QtMultimediaWidgets import QVideoWidget
+from PyQt6.QtCore import Qt, QTimer, QUrl, QByteArray, QBuffer, QIODevice
+
+_VIDEO_QSS: Final[str] = "background-color: black;"
+_MAIN_QSS: Final[str] = """
+    QMainWindow {
+        background-color: black;
+    }
+"""
+_TITLE_QSS: Final[str] = """
+    font-size: 28px;
+    font-weight: bold;
+    color: #0033CC;
+    margin-top: 20px;
+    margin-bottom: 5px;
+"""
+_SUBTITLE_QSS: Final[str] = """
+    font-size: 14px;
+    color: #666666;
+    margin-bottom: 15px;
+    font-weight: normal;
+"""
+_BUTTON_QSS: Final[str] = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+_MAIN_PAGE_QSS: Final[str] = """
+    QWidget {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1.5, y2:1.5,
+            stop:0 #FFFFFF,
+            stop:1 #E6F0FF
+        );
+    }
+"""
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PlakOn")
         self.setFixedSize(200, 300)
+        self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         self.video_page = QWidget()
         self.setup_video_page()
@@ -19,34 +61,45 @@ class MainWindow(QMainWindow):
         self.stacked_widget.addWidget(self.video_page)
         self.stacked_widget.addWidget(self.main_page)
         self.stacked_widget.setCurrentWidget(self.video_page)
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: black;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
     
     def setup_video_page(self):
         layout = QVBoxLayout()
         self.video_page.setLayout(layout)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        video_path = "grok-video-dc701094-adfa-49fc-9dc0-a3135b8a6c79.mp4"
+        if not os.path.exists(video_path):
+            print(f"خطا: فایل ویدیو پیدا نشد!")
+            QTimer.singleShot(100, self.go_to_main_page)
+            return
+        # QtMultimedia loads the media backend on import, so only pay for it
+        # when there is actually a splash video to play.
+        from PyQt6.QtMultimedia import QMediaPlayer
+        from PyQt6.QtMultimediaWidgets import QVideoWidget
+        self._end_of_media = QMediaPlayer.MediaStatus.EndOfMedia
+
         self.video_widget = QVideoWidget()
-        self.video_widget.setStyleSheet("background-color: black;")
+        self.video_widget.setStyleSheet(_VIDEO_QSS)
         layout.addWidget(self.video_widget)
         self.player = QMediaPlayer()
         self.player.setVideoOutput(self.video_widget)
-        video_path = "grok-video-dc701094-adfa-49fc-9dc0-a3135b8a6c79.mp4"
-        if os.path.exists(video_path):
-            self.player.setSource(QUrl.fromLocalFile(os.path.abspath(video_path)))
-            self.player.play()
-            print(f"در حال پخش ویدیو: {video_path}")
-            self.player.mediaStatusChanged.connect(self.on_video_finished)
-        else:
-            print(f"خطا: فایل ویدیو پیدا نشد!")
-            QTimer.singleShot(100, self.go_to_main_page)
+        # Feed the player from memory; probing the file on disk stalls the
+        # first play() on several Qt6 backends.
+        with open(video_path, "rb") as f:
+            self.video_bytes = QByteArray(f.read())
+        # QBuffer only keeps a pointer to the byte array, so the bytes must
+        # stay referenced on the window for as long as the player reads them.
+        self.video_buffer = QBuffer(self.video_bytes)
+        self.video_buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        self.player.setSourceDevice(self.video_buffer,
+                                    QUrl.fromLocalFile(os.path.abspath(video_path)))
+        self.player.play()
+        print(f"در حال پخش ویدیو: {video_path}")
+        self.player.mediaStatusChanged.connect(self.on_video_finished)
     
     def on_video_finished(self, status):
-        if status == QMediaPlayer.MediaStatus.EndOfMedia:
+        if status == self._end_of_media:
             print("ویدیو به پایان رسید")
             QTimer.singleShot(500, self.go_to_main_page)
     
@@ -60,36 +113,13 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(10, 15, 10, 15)
         title_label = QLabel("PlakOn")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            font-size: 28px;
-            font-weight: bold;
-            color: #0033CC;
-            margin-top: 20px;
-            margin-bottom: 5px;
-        """)
+        title_label.setStyleSheet(_TITLE_QSS)
         subtitle_label = QLabel("تشخیص پلاک")
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle_label.setStyleSheet("""
-            font-size: 14px;
-            color: #666666;
-            margin-bottom: 15px;
-            font-weight: normal;
-        """)
+        subtitle_label.setStyleSheet(_SUBTITLE_QSS)
         start_button = QPushButton("شروع")
         start_button.setFixedSize(120, 35)
-        start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        start_button.setStyleSheet(_BUTTON_QSS)
         start_button.clicked.connect(self.start_program)
         layout.addStretch(1)
         layout.addWidget(title_label)
@@ -97,15 +127,7 @@ class MainWindow(QMainWindow):
         layout.addSpacing(10)
         layout.addWidget(start_button, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addStretch(2)
-        self.main_page.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1.5, y2:1.5,
-                    stop:0 #FFFFFF,
-                    stop:1 #E6F0FF
-                );
-            }
-        """)
+        self.main_page.setStyleSheet(_MAIN_PAGE_QSS)
     
     def start_program(self):
         print("برنامه شروع شد!")